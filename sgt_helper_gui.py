@@ -2,6 +2,9 @@ import json
 import os
 import re
 import io
+import sys
+from array import array
+from collections.abc import MutableMapping, MutableSequence
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from typing import Dict, List, Tuple
@@ -10,14 +13,292 @@ import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 from PIL import Image, ImageTk
 
+
+class CompactEntryList(MutableSequence):
+    """Live view of one topic's entries in a CompactDataStore.
+
+    Strings are only decoded when an entry is accessed.
+    """
+    __slots__ = ("_store", "_topic")
+
+    def __init__(self, store: "CompactDataStore", topic: str):
+        self._store = store
+        self._topic = topic
+
+    def __len__(self) -> int:
+        return len(self._store._topics[self._topic]) - 1
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("entry index out of range")
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = self._index(index)
+        offsets = self._store._topics[self._topic]
+        return self._store._buffer[offsets[index]:offsets[index + 1]].decode("utf-8")
+
+    def __setitem__(self, index, value):
+        if not isinstance(index, slice):
+            index = self._index(index)
+            self._store._splice(self._topic, index, index + 1, [value])
+            return
+        values = list(value)
+        start, stop, step = index.indices(len(self))
+        if step == 1:
+            self._store._splice(self._topic, start, max(start, stop), values)
+            return
+        indices = range(start, stop, step)
+        if len(values) != len(indices):
+            raise ValueError(f"attempt to assign sequence of size {len(values)} "
+                             f"to extended slice of size {len(indices)}")
+        for i, entry in zip(indices, values):
+            self._store._splice(self._topic, i, i + 1, [entry])
+
+    def __delitem__(self, index):
+        if not isinstance(index, slice):
+            index = self._index(index)
+            self._store._splice(self._topic, index, index + 1, [])
+            return
+        start, stop, step = index.indices(len(self))
+        if step == 1:
+            self._store._splice(self._topic, start, max(start, stop), [])
+            return
+        # Delete from the highest index down so earlier indices stay valid
+        for i in sorted(range(start, stop, step), reverse=True):
+            self._store._splice(self._topic, i, i + 1, [])
+
+    def insert(self, index: int, value: str):
+        if index < 0:
+            index += len(self)
+        index = max(0, min(index, len(self)))
+        self._store._splice(self._topic, index, index, [value])
+
+    def extend(self, values):
+        # Snapshot first: `values` may be another view of this same topic
+        self._store._splice(self._topic, len(self), len(self), list(values))
+
+    def __eq__(self, other):
+        if isinstance(other, (list, CompactEntryList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CompactEntryList({list(self)!r})"
+
+
+class CompactDataStore(MutableMapping):
+    """Memory-compact replacement for the topic -> entries dict.
+
+    All entries share a single bytearray holding their UTF-8 encoding. Each
+    topic is a contiguous region of it described by one array of n + 1
+    offsets, so entry i is buffer[offsets[i]:offsets[i + 1]]. Regions left
+    behind by edits are reclaimed once they outweigh the live data.
+    """
+    _WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self, data: Dict = None):
+        """Build a store from a dict of topic -> entries; `data` is not modified."""
+        self._buffer = bytearray()
+        self._dead_bytes = 0
+        self._topics: Dict[str, array] = {}
+        if data:
+            for topic, entries in data.items():
+                self[topic] = entries
+
+    @classmethod
+    def from_json_file(cls, path: str, chunk_size: int = 1 << 16) -> "CompactDataStore":
+        """Load a topic -> entries JSON file one topic at a time.
+
+        The file is read in chunks, so at most one topic's text and entries
+        exist as Python objects at once instead of the whole file and dict.
+        Raises TypeError if an entry is not a string.
+        """
+        decoder = json.JSONDecoder()
+        store = cls()
+        with open(path, "r", encoding="utf-8") as f:
+            text = ""
+            pos = 0
+
+            def read_more() -> bool:
+                # Drop consumed text; read at least as much as is buffered so retries stay linear
+                nonlocal text, pos
+                data = f.read(max(chunk_size, len(text) - pos))
+                text = text[pos:] + data
+                pos = 0
+                return bool(data)
+
+            def peek() -> str:
+                nonlocal pos
+                while True:
+                    pos = cls._WHITESPACE.match(text, pos).end()
+                    if pos < len(text) or not read_more():
+                        return text[pos:pos + 1]
+
+            def decode():
+                nonlocal pos
+                while True:
+                    try:
+                        value, pos = decoder.raw_decode(text, pos)
+                        return value
+                    except json.JSONDecodeError:
+                        # The value may just be cut off at the end of the chunk
+                        if not read_more():
+                            raise
+
+            if peek() != "{":
+                raise json.JSONDecodeError("Expecting '{'", text, pos)
+            pos += 1
+            if peek() == "}":
+                pos += 1
+            else:
+                while True:
+                    if peek() != '"':
+                        raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, pos)
+                    topic = decode()
+                    if peek() != ":":
+                        raise json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+                    pos += 1
+                    peek()
+                    value_pos = pos
+                    entries = decode()
+                    if not isinstance(entries, list):
+                        raise json.JSONDecodeError("Expecting a list of entries", text, value_pos)
+                    store[topic] = entries
+                    del entries
+                    delimiter = peek()
+                    pos += 1
+                    if delimiter == "}":
+                        break
+                    if delimiter != ",":
+                        raise json.JSONDecodeError("Expecting ',' delimiter", text, pos - 1)
+            if peek():
+                raise json.JSONDecodeError("Extra data", text, pos)
+        return store
+
+    def dump(self, f):
+        """Write the store as JSON, formatted exactly like json.dump(data, f, indent=4)."""
+        if not self._topics:
+            f.write("{}")
+            return
+        f.write("{")
+        for i, (topic, offsets) in enumerate(self._topics.items()):
+            f.write(("," if i else "") + "\n    " + json.dumps(topic) + ": ")
+            if len(offsets) == 1:
+                f.write("[]")
+                continue
+            f.write("[")
+            for j in range(len(offsets) - 1):
+                entry = self._buffer[offsets[j]:offsets[j + 1]].decode("utf-8")
+                f.write(("," if j else "") + "\n        " + json.dumps(entry))
+            f.write("\n    ]")
+        f.write("\n}")
+
+    @staticmethod
+    def _encode(value: str) -> bytes:
+        # Entries must be strings; json.load would also accept numbers, lists, etc.
+        if not isinstance(value, str):
+            raise TypeError(f"entries must be str, not {type(value).__name__}")
+        return value.encode("utf-8")
+
+    @staticmethod
+    def _make_offsets(values: List[int]) -> array:
+        # 4-byte offsets while the buffer stays under 4 GiB
+        return array("I" if values[-1] <= 0xFFFFFFFF else "Q", values)
+
+    def _release(self, offsets: array):
+        """Give up a topic's region, truncating the buffer if it is the last one."""
+        if offsets[-1] == len(self._buffer):
+            del self._buffer[offsets[0]:]
+        else:
+            self._dead_bytes += offsets[-1] - offsets[0]
+
+    def _splice(self, topic: str, start: int, stop: int, values: List[str]):
+        """Replace entries [start:stop) of a topic with `values`, like list slice assignment."""
+        encoded = [self._encode(value) for value in values]
+        offsets = self._topics[topic]
+        lengths_after = [offsets[i + 1] - offsets[i] for i in range(stop, len(offsets) - 1)]
+        if offsets[-1] == len(self._buffer):
+            # Region is at the end of the buffer: rewrite it in place from `start`
+            tail = bytes(self._buffer[offsets[stop]:])
+            del self._buffer[offsets[start]:]
+            new_offsets = list(offsets[:start + 1])
+        else:
+            # Move the whole region to the end and leave the old one dead
+            head = bytes(self._buffer[offsets[0]:offsets[start]])
+            tail = bytes(self._buffer[offsets[stop]:offsets[-1]])
+            self._dead_bytes += offsets[-1] - offsets[0]
+            shift = len(self._buffer) - offsets[0]
+            new_offsets = [offset + shift for offset in offsets[:start + 1]]
+            self._buffer += head
+        for value in encoded:
+            self._buffer += value
+            new_offsets.append(len(self._buffer))
+        for length in lengths_after:
+            new_offsets.append(new_offsets[-1] + length)
+        self._buffer += tail
+        self._topics[topic] = self._make_offsets(new_offsets)
+        self._maybe_repack()
+
+    def _maybe_repack(self):
+        if self._dead_bytes and self._dead_bytes > len(self._buffer) // 2:
+            self.repack()
+
+    def repack(self):
+        """Rebuild the buffer without the bytes of deleted or replaced entries."""
+        buffer = bytearray()
+        for topic, offsets in self._topics.items():
+            shift = len(buffer) - offsets[0]
+            buffer += self._buffer[offsets[0]:offsets[-1]]
+            self._topics[topic] = self._make_offsets([offset + shift for offset in offsets])
+        self._buffer = buffer
+        self._dead_bytes = 0
+
+    def __getitem__(self, topic: str) -> CompactEntryList:
+        if topic not in self._topics:
+            raise KeyError(topic)
+        return CompactEntryList(self, topic)
+
+    def __setitem__(self, topic: str, entries):
+        # Encode before releasing the old region: `entries` may be a view of it
+        encoded = [self._encode(entry) for entry in entries]
+        if topic in self._topics:
+            self._release(self._topics[topic])
+        offsets = [len(self._buffer)]
+        for value in encoded:
+            self._buffer += value
+            offsets.append(len(self._buffer))
+        self._topics[topic] = self._make_offsets(offsets)
+        self._maybe_repack()
+
+    def __delitem__(self, topic: str):
+        self._release(self._topics.pop(topic))
+        self._maybe_repack()
+
+    def __iter__(self):
+        return iter(self._topics)
+
+    def __len__(self) -> int:
+        return len(self._topics)
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """Return the data as a plain dict of lists."""
+        return {topic: list(self[topic]) for topic in self._topics}
+
+
 class SGTHelperGUI:
-    def __init__(self, root):
+    def __init__(self, root, compact: bool = False):
         self.root = root
         self.root.title("Spectral Graph Theory Helper")
         self.root.geometry("900x700")
         self.root.configure(bg="#f0f0f0")
         
         self.json_path = "info.json"
+        self.compact = compact  # Store entries in a packed buffer instead of a dict of lists
         self.data_store = self.load_data()
         self.current_topic = None
         self.latex_cache = {}  # Cache rendered LaTeX images
@@ -31,13 +312,24 @@ class SGTHelperGUI:
         if not os.path.exists(self.json_path):
             with open(self.json_path, "w", encoding="utf-8") as f:
                 f.write("{}")
+        if self.compact:
+            try:
+                return CompactDataStore.from_json_file(self.json_path)
+            except TypeError as e:
+                # The compact store only holds string entries; fall back to a plain dict
+                messagebox.showwarning("Warning", f"Could not use the compact store for {self.json_path}:\n{e}\n\n"
+                                                  "Loading it as a regular dictionary instead.")
+                self.compact = False
         with open(self.json_path, "r", encoding="utf-8") as f:
             return json.load(f)
     
     def save_data(self):
         """Save data to JSON file."""
         with open(self.json_path, "w", encoding="utf-8") as f:
-            json.dump(self.data_store, f, indent=4)
+            if isinstance(self.data_store, CompactDataStore):
+                self.data_store.dump(f)
+            else:
+                json.dump(self.data_store, f, indent=4)
     
     def setup_ui(self):
         """Set up the user interface."""
@@ -640,9 +932,9 @@ class SGTHelperGUI:
         self.root.destroy()
 
 
-def main():
+def main(compact: bool = False):
     root = tk.Tk()
-    app = SGTHelperGUI(root)
+    app = SGTHelperGUI(root, compact=compact)
     root.mainloop()
     
 def test_program():
@@ -651,10 +943,212 @@ def test_program():
     txt = "v_1"
     app.render_latex_to_image(txt, 100, 10, "img/img3.png")
 
+def test_compact_store(seed: int = 0, steps: int = 2000):
+    """Run the GUI's data_store operations on a dict and a CompactDataStore and compare."""
+    import random
+    import tempfile
+    
+    rng = random.Random(seed)
+    initial = {"Theorems": ["Courant-Fisher", "$a_1 \\geq a_2$"], "Empty": [], "Graphs": ["é ∑ 🙂"]}
+    expected = json.loads(json.dumps(initial))
+    store = CompactDataStore(initial)
+    assert initial == expected, "constructor modified its input"
+    
+    def random_entry():
+        return "".join(rng.choice("ab$\\_é∑🙂 ") for _ in range(rng.randint(0, 40)))
+    
+    for step in range(steps):
+        topics = sorted(expected)
+        op = rng.randrange(11)
+        if op == 0 or not topics:
+            topic = f"topic {rng.randrange(20)}"
+            entries = [random_entry() for _ in range(rng.randrange(4))]
+            expected[topic] = list(entries)
+            store[topic] = entries
+            continue
+        topic = rng.choice(topics)
+        size = len(expected[topic])
+        if op == 1:
+            del expected[topic]
+            del store[topic]
+        elif op == 2:
+            store[topic] = store[topic]  # Re-assign a topic to its own view
+        elif op == 3 or size == 0:
+            entry = random_entry()
+            expected[topic].append(entry)
+            store[topic].append(entry)
+        elif op == 4:
+            index = rng.randrange(size)
+            entry = random_entry()
+            expected[topic][index] = entry
+            store[topic][index] = entry
+        elif op == 5:
+            index = rng.randrange(-size, size)
+            del expected[topic][index]
+            del store[topic][index]
+        elif op == 6:
+            index = rng.randrange(size + 1)
+            entry = random_entry()
+            expected[topic].insert(index, entry)
+            store[topic].insert(index, entry)
+        elif op == 7 and size < 8:
+            # Extend a topic with itself, through extend and +=
+            expected[topic].extend(expected[topic])
+            store[topic].extend(store[topic])
+            expected[topic] += expected[topic][:2]
+            store[topic] += store[topic][:2]
+        elif op == 8:
+            index = slice(rng.randrange(-size, size), rng.randrange(-size, size + 1), rng.choice([1, 2, -1, -3]))
+            del expected[topic][index]
+            del store[topic][index]
+        elif op == 9:
+            index = slice(rng.randrange(size), None, rng.choice([1, 2, -1]))
+            entries = [random_entry() for _ in range(len(range(*index.indices(size))))]
+            expected[topic][index] = entries
+            store[topic][index] = entries
+        else:
+            store.repack()
+        assert store.to_dict() == expected, f"mismatch after step {step} (op {op})"
+        assert sorted(store.keys()) == sorted(expected)
+    
+    out = io.StringIO()
+    store.dump(out)
+    assert out.getvalue() == json.dumps(expected, indent=4), "dump differs from json.dump"
+    fd, path = tempfile.mkstemp(suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(out.getvalue())
+        for chunk_size in (1, 7, 1 << 20):
+            loaded = CompactDataStore.from_json_file(path, chunk_size=chunk_size)
+            assert loaded.to_dict() == expected, f"load mismatch with chunk_size={chunk_size}"
+    finally:
+        os.remove(path)
+    print(f"CompactDataStore matches dict after {steps} operations")
+
+def _read_proc_rss() -> Tuple[int, int]:
+    """Return (current, peak) resident memory in bytes from /proc/self/status (Linux only)."""
+    sizes = {}
+    with open("/proc/self/status", "r") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("VmRSS", "VmHWM"):
+                sizes[key] = int(value.split()[0]) * 1024
+    return sizes["VmRSS"], sizes["VmHWM"]
+
+def _measure_store(json_path: str, compact: bool, trace: bool, queue):
+    """Build one store in a fresh process and report its memory through `queue`.
+    
+    With `trace`, puts tracemalloc's (current, peak); otherwise puts the
+    (current, peak) growth of resident memory during the load, either of
+    which may be None when it can't be measured. Exceptions are put on the
+    queue for the parent to re-raise.
+    """
+    try:
+        if trace:
+            import tracemalloc
+            tracemalloc.start()
+        else:
+            try:
+                # Reset the peak RSS so it excludes this process's imports
+                with open("/proc/self/clear_refs", "w") as f:
+                    f.write("5")
+                rss_before, _ = _read_proc_rss()
+                use_proc = True
+            except (OSError, KeyError, ValueError):
+                import resource
+                maxrss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                use_proc = False
+        
+        if compact:
+            store = CompactDataStore.from_json_file(json_path)
+        else:
+            with open(json_path, "r", encoding="utf-8") as f:
+                store = json.load(f)
+        
+        if trace:
+            queue.put(tracemalloc.get_traced_memory())
+        elif use_proc:
+            rss_after, rss_peak = _read_proc_rss()
+            queue.put((rss_after - rss_before, rss_peak - rss_before))
+        else:
+            growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - maxrss_before
+            # ru_maxrss is a high-water mark that includes imports, so no growth means unknown
+            if growth <= 0:
+                growth = None
+            elif sys.platform != "darwin":  # Kilobytes on Linux, bytes on macOS
+                growth *= 1024
+            queue.put((None, growth))
+    except BaseException as e:
+        queue.put(e)
+
+def measure_store_memory(json_path: str = "info.json") -> Dict[str, Dict[str, int]]:
+    """Measure the memory of loading a JSON file as a dict and as a CompactDataStore.
+    
+    Each measurement runs in its own process. "current" and "peak" are the
+    tracemalloc sizes after and during loading; "rss" and "peak rss" are the
+    growth of resident memory after and during loading. Sizes that can't be
+    measured on this platform are None.
+    """
+    import multiprocessing
+    from queue import Empty
+    
+    if not os.path.exists(json_path):
+        raise FileNotFoundError(f"No such file: {json_path!r}")
+    
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+    for name, compact in (("dict", False), ("compact", True)):
+        sizes = {"rss": None, "peak rss": None}
+        runs = [True] if sys.platform == "win32" else [True, False]
+        for trace in runs:
+            queue = ctx.Queue()
+            process = ctx.Process(target=_measure_store, args=(json_path, compact, trace, queue))
+            process.start()
+            try:
+                while True:
+                    try:
+                        value = queue.get(timeout=1)
+                        break
+                    except Empty:
+                        if not process.is_alive() and queue.empty():
+                            raise RuntimeError(f"Memory measurement process exited with code {process.exitcode}")
+            finally:
+                process.join()
+                queue.close()
+            if isinstance(value, BaseException):
+                raise value
+            if trace:
+                sizes["current"], sizes["peak"] = value
+            else:
+                sizes["rss"], sizes["peak rss"] = value
+        results[name] = sizes
+    return results
+
+def report_memory_usage(json_path: str = "info.json"):
+    sizes = measure_store_memory(json_path)
+    keys = ("current", "peak", "rss", "peak rss")
+    print(f"File size: {os.path.getsize(json_path):,} bytes")
+    print(f"{'':<10}" + "".join(f"{key:>15}" for key in keys))
+    for name in ("dict", "compact"):
+        print(f"{name:<10}" + "".join(f"{sizes[name][key]:>15,}" if sizes[name][key] is not None else f"{'n/a':>15}"
+                                      for key in keys))
+    for key in keys:
+        baseline, compact = sizes["dict"][key], sizes["compact"][key]
+        if baseline and compact is not None:
+            print(f"compact {key}: {compact / baseline:.1%} of dict")
+        else:
+            print(f"compact {key}: n/a (no measurable dict baseline)")
 
 if __name__ == "__main__":
     test = False
+    test_store = False
+    compact = False  # Use the packed store for very large knowledge bases (entries must be strings)
+    memory_report = False
     if test:
         test_program()
+    elif test_store:
+        test_compact_store()
+    elif memory_report:
+        report_memory_usage()
     else:
-        main()
+        main(compact)